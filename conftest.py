@@ -0,0 +1,8 @@
+"""
+Shared pytest configuration
+"""
+import sys
+from pathlib import Path
+
+# Import the modules under test from this directory, wherever pytest is run from
+sys.path.insert(0, str(Path(__file__).parent))
@@ -1,46 +1,368 @@
 """
 Data loader module for loading data from various sources
 """
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
-from typing import List, Dict, Optional
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.engine import Engine
+from typing import Callable, List, Dict, Iterator, Optional, Union
+import atexit
+import csv
+from collections import Counter
+from decimal import Decimal
+import io
 import json
 import os
 from pathlib import Path
 
+try:
+    # Optional: multi-threaded CSV writer for large frames
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    # Optional: faster JSON parsing and serialization
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Parquet I/O, and text columns stored in contiguous Arrow buffers
+    import pyarrow as pa
+    import pyarrow.parquet as pa_parquet
+    TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    TEXT_DTYPE = 'string'
+
+
+# Row count above which save_to_csv hands the frame to polars
+PARALLEL_CSV_MIN_ROWS = 100_000
+
+# Buffer size for CSV/JSON output files, so large writes take few syscalls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Pooled engines reused across calls, keyed by connection string
+_ENGINE_CACHE: Dict[str, Engine] = {}
+
+
+def _get_engine(connection_string: str) -> Engine:
+    """Return a pooled engine for the connection string, creating it on first use"""
+    engine = _ENGINE_CACHE.get(connection_string)
+    if engine is None:
+        url = make_url(connection_string)
+        engine_options = {'pool_pre_ping': True, 'pool_recycle': 1800}
+        # SQLite in-memory/singleton pools do not accept queue pool sizing
+        if url.get_backend_name() != 'sqlite':
+            engine_options.update(pool_size=10, max_overflow=20)
+        # Route plain executemany calls through psycopg2's batched fast path
+        if url.get_driver_name() == 'psycopg2':
+            engine_options['executemany_mode'] = 'values_plus_batch'
+        engine = create_engine(connection_string, **engine_options)
+        _ENGINE_CACHE[connection_string] = engine
+    return engine
+
+
+# polars datetime formats matching pandas' CSV output, keyed by the
+# coarsest unit (in nanoseconds) every value in the column is a multiple of
+_PANDAS_DATETIME_FORMATS = [
+    (86_400 * 10**9, '%Y-%m-%d'),
+    (10**9, '%Y-%m-%d %H:%M:%S'),
+    (10**6, '%Y-%m-%d %H:%M:%S%.3f'),
+    (10**3, '%Y-%m-%d %H:%M:%S%.6f'),
+    (1, '%Y-%m-%d %H:%M:%S%.9f'),
+]
+
+
+def _has_polars_quoted_text(values: Union[pd.Series, pd.Index]) -> bool:
+    """True if polars would quote a value pandas leaves bare ('' or one with a carriage return)"""
+    return bool((values.str.len() == 0).any() or values.str.contains('\r', regex=False).any())
+
+
+def _polars_csv_options(df: pd.DataFrame) -> Optional[Dict]:
+    """
+    Return polars write_csv options that reproduce df.to_csv byte for byte
+    
+    polars formats booleans, floats in [1e-9, 1e-4) (e.g. 5e-6 vs 5e-06),
+    empty strings, carriage returns, NaT and the nulls of a single-column
+    frame (an empty line rather than "") differently from pandas, so None
+    is returned for frames containing any of them, or any dtype not
+    handled here. Datetime columns get pandas' precision-dependent format.
+    """
+    if not all(isinstance(name, str) for name in df.columns):
+        return None
+    if _has_polars_quoted_text(df.columns):
+        return None
+    if len(df.columns) == 1 and df.iloc[:, 0].isna().any():
+        return None
+    
+    datetime_formats = set()
+    for _, column in df.items():
+        dtype = column.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = column.cat.categories
+            if categories.inferred_type != 'string' or _has_polars_quoted_text(categories):
+                return None
+        elif pd.api.types.is_bool_dtype(dtype):
+            return None
+        elif pd.api.types.is_integer_dtype(dtype):
+            continue
+        elif dtype == np.float64:
+            magnitude = np.abs(column.to_numpy())
+            if ((magnitude >= 1e-9) & (magnitude < 1e-4)).any():
+                return None
+        elif dtype.kind == 'M' and getattr(dtype, 'tz', None) is None:
+            if column.isna().any():
+                return None
+            ticks = column.to_numpy(dtype='datetime64[ns]').view('i8')
+            datetime_formats.add(next(
+                fmt for unit, fmt in _PANDAS_DATETIME_FORMATS if (ticks % unit == 0).all()
+            ))
+        elif pd.api.types.is_string_dtype(dtype):
+            if pd.api.types.infer_dtype(column, skipna=True) not in ('string', 'empty'):
+                return None
+            if _has_polars_quoted_text(column):
+                return None
+        else:
+            return None
+    
+    # write_csv takes one datetime format for every column
+    if len(datetime_formats) > 1:
+        return None
+    return {'datetime_format': datetime_formats.pop()} if datetime_formats else {}
+
+
+def _json_loads(raw: bytes):
+    """Parse a JSON document with orjson when available, else the json module"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_default(value):
+    """Serialize pandas scalars orjson does not handle natively"""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # Written as a string, like to_json, so no precision is lost
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class _CopyNull:
+    """
+    Stand-in for None in COPY rows, written as a bare \\N
+    
+    csv.QUOTE_NONNUMERIC leaves objects supporting float() unquoted, so the
+    marker stays bare while every string (including a literal '\\N') is
+    quoted, and COPY ... NULL '\\N' only turns real NULLs into NULL.
+    """
+    
+    def __float__(self) -> float:
+        return float('nan')
+    
+    def __str__(self) -> str:
+        return '\\N'
+
+
+_COPY_NULL = _CopyNull()
+
+
+class _CsvRowReader(io.TextIOBase):
+    """Read-only text stream that renders row tuples as COPY CSV lines on demand"""
+    
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, quoting=csv.QUOTE_NONNUMERIC)
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None:
+            size = -1
+        
+        # Render just enough rows to fill the request
+        while size < 0 or self._buffer.tell() < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow([_COPY_NULL if value is None else value for value in row])
+        
+        data = self._buffer.getvalue()
+        data, rest = (data, '') if size < 0 else (data[:size], data[size:])
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._buffer.write(rest)
+        return data
+
+
+def _postgres_copy(table, conn, keys, data_iter) -> None:
+    """
+    DataFrame.to_sql insert method that bulk loads rows with PostgreSQL COPY
+    
+    Args:
+        table: pandas SQLTable being written
+        conn: SQLAlchemy connection
+        keys: Column names
+        data_iter: Iterable of row tuples
+    """
+    # copy_expert pulls fixed-size reads, so only one read's worth of CSV
+    # is held in memory at a time
+    buffer = _CsvRowReader(data_iter)
+    
+    # Quote identifiers the way the dialect did when to_sql created the table
+    preparer = conn.dialect.identifier_preparer
+    columns = ', '.join(preparer.quote(key) for key in keys)
+    table_name = preparer.quote(table.name)
+    if table.schema:
+        table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+    
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer
+        )
+
+
+# Per-backend (to_sql method, chunksize) defaults for save_to_database.
+# Multi-row VALUES would exceed SQLite's bound-parameter limit, and its
+# in-process executemany is already fast.
+_INSERT_DEFAULTS = {
+    'postgresql': (_postgres_copy, 100_000),
+    'sqlite': (None, None),
+}
+
+
+# Statistics written to batch summaries, in report order
+SUMMARY_STATS = ['mean', 'median', 'std', 'min', 'max']
+
+
+def _score_stats(values: np.ndarray, columns: List[str]) -> pd.DataFrame:
+    """
+    Compute SUMMARY_STATS for each column of a 2-D float array
+    
+    Pipeline output has no missing scores, so each statistic is one NumPy
+    reduction over all columns at once. Arrays with NaNs, or too few rows
+    for a sample std, go through DataFrame.agg, which skips NaNs.
+    """
+    if len(values) < 2 or np.isnan(values).any():
+        return pd.DataFrame(values, columns=columns).agg(SUMMARY_STATS)
+    
+    return pd.DataFrame(
+        [
+            values.mean(axis=0),
+            np.median(values, axis=0),
+            values.std(axis=0, ddof=1),
+            values.min(axis=0),
+            values.max(axis=0)
+        ],
+        index=SUMMARY_STATS,
+        columns=columns
+    )
+
+
+@atexit.register
+def _dispose_engines() -> None:
+    """Close pooled connections on interpreter exit"""
+    for engine in _ENGINE_CACHE.values():
+        engine.dispose()
+    _ENGINE_CACHE.clear()
+
 
 class DataLoader:
     """Load data from various sources"""
     
     def __init__(self):
         """Initialize data loader"""
-        self.supported_formats = ['csv', 'json', 'postgres', 'mysql']
+        self.supported_formats = ['csv', 'json', 'parquet', 'postgres', 'mysql']
     
-    def load_from_csv(self, file_path: str, text_column: str) -> pd.DataFrame:
+    def load_from_csv(
+        self,
+        file_path: str,
+        text_column: str,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict] = None
+    ) -> pd.DataFrame:
         """
         Load data from CSV file
         
         Args:
             file_path: Path to CSV file
             text_column: Name of column containing text to analyze
+            usecols: Columns to parse (text column is always included); all if None
+            dtype: Column dtypes to parse with instead of inferring them
             
         Returns:
             DataFrame with text data
         """
+        # Same C-engine parse as load_from_csv_chunks, so whole and streamed
+        # runs agree (pyarrow's engine re-infers ISO strings as datetimes)
+        read_options = self._csv_read_options(file_path, text_column, usecols, dtype)
+        df = pd.read_csv(file_path, **read_options)
+        
+        print(f"✓ Loaded {len(df)} rows from CSV: {file_path}")
+        return df
+    
+    def load_from_csv_chunks(
+        self,
+        file_path: str,
+        text_column: str,
+        chunksize: int = 100_000,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Load data from CSV file in chunks to bound memory use
+        
+        Args:
+            file_path: Path to CSV file
+            text_column: Name of column containing text to analyze
+            chunksize: Number of rows per chunk
+            usecols: Columns to parse (text column is always included); all if None
+            dtype: Column dtypes to parse with instead of inferring them
+            
+        Returns:
+            Iterator of DataFrames with text data
+        """
+        read_options = self._csv_read_options(file_path, text_column, usecols, dtype)
+        
+        print(f"✓ Streaming CSV in chunks of {chunksize} rows: {file_path}")
+        return pd.read_csv(file_path, chunksize=chunksize, **read_options)
+    
+    def _csv_read_options(
+        self,
+        file_path: str,
+        text_column: str,
+        usecols: Optional[List[str]],
+        dtype: Optional[Dict] = None
+    ) -> Dict:
+        """Validate the CSV header and build read_csv options for it"""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"CSV file not found: {file_path}")
         
-        df = pd.read_csv(file_path)
+        # Validate the header without parsing any rows
+        columns = pd.read_csv(file_path, nrows=0).columns
         
-        if text_column not in df.columns:
-            raise ValueError(f"Column '{text_column}' not found in CSV. Available: {df.columns.tolist()}")
+        if text_column not in columns:
+            raise ValueError(f"Column '{text_column}' not found in CSV. Available: {columns.tolist()}")
         
-        print(f"✓ Loaded {len(df)} rows from CSV: {file_path}")
-        return df
+        if usecols is not None:
+            missing = set(usecols).difference(columns)
+            if missing:
+                raise ValueError(f"Columns {sorted(missing)} not found in CSV. Available: {columns.tolist()}")
+            wanted = {text_column, *usecols}
+            usecols = [column for column in columns if column in wanted]
+        
+        # Parse text as strings up front instead of inferring its dtype
+        return {'usecols': usecols, 'dtype': {**(dtype or {}), text_column: TEXT_DTYPE}}
     
     def load_from_json(self, file_path: str, text_field: str) -> pd.DataFrame:
         """
-        Load data from JSON file
+        Load data from JSON file (array of objects, single object or JSON Lines)
         
         Args:
             file_path: Path to JSON file
@@ -52,21 +374,128 @@ class DataLoader:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"JSON file not found: {file_path}")
         
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Handle both array of objects and single object
-        if isinstance(data, dict):
-            data = [data]
+        with open(file_path, 'rb') as f:
+            raw = f.read()
         
-        df = pd.DataFrame(data)
+        try:
+            data = _json_loads(raw)
+        except ValueError:
+            # Not a single JSON document, parse as one object per line
+            df = pd.DataFrame([_json_loads(line) for line in raw.splitlines() if line.strip()])
+        else:
+            # Handle both array of objects and single object
+            if isinstance(data, dict):
+                data = [data]
+            
+            df = pd.DataFrame(data)
         
         if text_field not in df.columns:
             raise ValueError(f"Field '{text_field}' not found in JSON. Available: {df.columns.tolist()}")
         
+        df[text_field] = df[text_field].astype(TEXT_DTYPE)
+        
         print(f"✓ Loaded {len(df)} rows from JSON: {file_path}")
         return df
     
+    def load_from_json_chunks(
+        self,
+        file_path: str,
+        text_field: str,
+        chunksize: int = 100_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Load data from JSON Lines file (one object per line) in chunks
+        
+        Args:
+            file_path: Path to JSON Lines file
+            text_field: Name of field containing text to analyze
+            chunksize: Number of rows per chunk
+            
+        Returns:
+            Iterator of DataFrames with text data
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        
+        # Validate against the first record only
+        with open(file_path, 'r') as f:
+            first_record = json.loads(f.readline() or '{}')
+        
+        if text_field not in first_record:
+            raise ValueError(f"Field '{text_field}' not found in JSON. Available: {list(first_record)}")
+        
+        print(f"✓ Streaming JSON Lines in chunks of {chunksize} rows: {file_path}")
+        return self._iter_json_lines(file_path, text_field, chunksize)
+    
+    @staticmethod
+    def _iter_json_lines(file_path: str, text_field: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Yield DataFrames of up to chunksize JSON Lines records
+        
+        Records are parsed like load_from_json does, so fields keep their
+        JSON types (pd.read_json would coerce "01234" to 1234 and date-like
+        strings to datetimes) and streamed runs match whole-file runs.
+        """
+        def to_frame(records: List[Dict]) -> pd.DataFrame:
+            df = pd.DataFrame(records)
+            df[text_field] = df[text_field].astype(TEXT_DTYPE)
+            return df
+        
+        records = []
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                records.append(_json_loads(line))
+                if len(records) == chunksize:
+                    yield to_frame(records)
+                    records = []
+        
+        if records:
+            yield to_frame(records)
+    
+    def load_from_parquet(
+        self,
+        file_path: str,
+        text_column: str,
+        usecols: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Load data from Parquet file (requires pyarrow)
+        
+        Args:
+            file_path: Path to Parquet file
+            text_column: Name of column containing text to analyze
+            usecols: Columns to read (text column is always included); all if None
+            
+        Returns:
+            DataFrame with text data
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Parquet file not found: {file_path}")
+        
+        if pa is None:
+            raise ImportError("Reading Parquet files requires pyarrow")
+        
+        # Validate against the footer schema without reading any row groups
+        columns = pa_parquet.read_schema(file_path).names
+        
+        if text_column not in columns:
+            raise ValueError(f"Column '{text_column}' not found in Parquet. Available: {columns}")
+        
+        if usecols is not None:
+            missing = set(usecols).difference(columns)
+            if missing:
+                raise ValueError(f"Columns {sorted(missing)} not found in Parquet. Available: {columns}")
+            wanted = {text_column, *usecols}
+            usecols = [column for column in columns if column in wanted]
+        
+        df = pd.read_parquet(file_path, columns=usecols)
+        df[text_column] = df[text_column].astype(TEXT_DTYPE)
+        
+        print(f"✓ Loaded {len(df)} rows from Parquet: {file_path}")
+        return df
+    
     def load_from_database(
         self, 
         connection_string: str, 
@@ -84,19 +513,47 @@ class DataLoader:
         Returns:
             DataFrame with text data
         """
-        engine = create_engine(connection_string)
+        engine = _get_engine(connection_string)
+        df = pd.read_sql_query(query, engine)
         
-        try:
-            df = pd.read_sql_query(query, engine)
-            
-            if text_column not in df.columns:
-                raise ValueError(f"Column '{text_column}' not found in query results. Available: {df.columns.tolist()}")
+        if text_column not in df.columns:
+            raise ValueError(f"Column '{text_column}' not found in query results. Available: {df.columns.tolist()}")
+        
+        df[text_column] = df[text_column].astype(TEXT_DTYPE)
+        
+        print(f"✓ Loaded {len(df)} rows from database")
+        return df
+    
+    def load_from_database_chunks(
+        self,
+        connection_string: str,
+        query: str,
+        text_column: str,
+        chunksize: int = 50_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Load data from database in chunks using a server-side cursor
+        
+        Args:
+            connection_string: Database connection string
+            query: SQL query to execute
+            text_column: Name of column containing text to analyze
+            chunksize: Number of rows per chunk
             
-            print(f"✓ Loaded {len(df)} rows from database")
-            return df
+        Returns:
+            Iterator of DataFrames with text data
+        """
+        engine = _get_engine(connection_string)
         
-        finally:
-            engine.dispose()
+        # stream_results makes psycopg2/MySQL fetch rows as chunks are consumed
+        with engine.connect().execution_options(stream_results=True) as conn:
+            for i, chunk in enumerate(pd.read_sql_query(query, conn, chunksize=chunksize)):
+                if i == 0 and text_column not in chunk.columns:
+                    raise ValueError(f"Column '{text_column}' not found in query results. Available: {chunk.columns.tolist()}")
+                
+                chunk[text_column] = chunk[text_column].astype(TEXT_DTYPE)
+                print(f"✓ Loaded chunk of {len(chunk)} rows from database")
+                yield chunk
     
     def load_from_list(self, texts: List[str]) -> pd.DataFrame:
         """
@@ -118,48 +575,140 @@ class DataSaver:
     
     def __init__(self):
         """Initialize data saver"""
-        self.supported_formats = ['csv', 'json', 'postgres', 'mysql']
+        self.supported_formats = ['csv', 'json', 'parquet', 'feather', 'postgres', 'mysql']
     
     def save_to_csv(
         self, 
         df: pd.DataFrame, 
         file_path: str,
-        include_index: bool = False
+        include_index: bool = False,
+        append: bool = False,
+        parallel: bool = True
     ) -> None:
         """
         Save DataFrame to CSV file
         
+        Frames larger than PARALLEL_CSV_MIN_ROWS are written with polars'
+        multi-threaded writer when polars is installed and can produce the
+        same bytes as pandas (see _polars_csv_options). Other frames are
+        written by pandas.
+        
         Args:
             df: DataFrame to save
             file_path: Output file path
             include_index: Whether to include index in output
+            append: Append rows without a header instead of overwriting
+            parallel: Allow the polars writer; pass False when more chunks will
+                be appended, so pandas writes the whole file
         """
         output_dir = Path(file_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        df.to_csv(file_path, index=include_index)
+        polars_options = None
+        if parallel and not (include_index or append or len(df) < PARALLEL_CSV_MIN_ROWS or pl is None):
+            polars_options = _polars_csv_options(df)
+        
+        if polars_options is not None:
+            try:
+                pl.from_pandas(df).write_csv(file_path, **polars_options)
+                print(f"✓ Saved {len(df)} rows to CSV: {file_path}")
+                return
+            except (TypeError, ValueError, pl.exceptions.PolarsError):
+                pass
+        
+        with open(file_path, 'a' if append else 'w', buffering=WRITE_BUFFER_SIZE,
+                  encoding='utf-8', newline='') as f:
+            df.to_csv(f, index=include_index, header=not append)
         print(f"✓ Saved {len(df)} rows to CSV: {file_path}")
     
+    def save_to_parquet(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        compression: str = 'zstd',
+        include_index: bool = False
+    ) -> None:
+        """
+        Save DataFrame to Parquet file (requires pyarrow)
+        
+        Args:
+            df: DataFrame to save
+            file_path: Output file path
+            compression: Parquet compression codec
+            include_index: Whether to include index in output
+        """
+        output_dir = Path(file_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        df.to_parquet(file_path, compression=compression, index=include_index)
+        print(f"✓ Saved {len(df)} rows to Parquet: {file_path}")
+    
+    def save_to_feather(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        compression: str = 'zstd'
+    ) -> None:
+        """
+        Save DataFrame to Feather file (requires pyarrow)
+        
+        Args:
+            df: DataFrame to save
+            file_path: Output file path
+            compression: Feather compression codec ('zstd', 'lz4' or 'uncompressed')
+        """
+        output_dir = Path(file_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Feather only stores a default RangeIndex
+        df.reset_index(drop=True).to_feather(file_path, compression=compression)
+        print(f"✓ Saved {len(df)} rows to Feather: {file_path}")
+    
     def save_to_json(
         self, 
         df: pd.DataFrame, 
         file_path: str,
         orient: str = 'records',
-        indent: int = 2
+        indent: int = 2,
+        lines: bool = False,
+        append: bool = False
     ) -> None:
         """
         Save DataFrame to JSON file
         
+        Records output is serialized with orjson when it is installed and
+        the indent is 0 or 2 (the only indent orjson supports).
+        
         Args:
             df: DataFrame to save
             file_path: Output file path
             orient: Format of JSON output
             indent: JSON indentation level
+            lines: Write JSON Lines (one record per line) instead of an array
+            append: Append records to an existing JSON Lines file
         """
         output_dir = Path(file_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        df.to_json(file_path, orient=orient, indent=indent)
+        if orjson is not None and (lines or (orient == 'records' and indent in (None, 0, 2))):
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            records = df.to_dict(orient='records')
+            
+            with open(file_path, 'ab' if append else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                if lines:
+                    # Stream one record per line through the buffer
+                    for record in records:
+                        f.write(orjson.dumps(record, default=_json_default, option=options))
+                        f.write(b'\n')
+                else:
+                    if indent:
+                        options |= orjson.OPT_INDENT_2
+                    f.write(orjson.dumps(records, default=_json_default, option=options))
+        elif lines:
+            df.to_json(file_path, orient='records', lines=True, date_format='iso',
+                       mode='a' if append else 'w')
+        else:
+            df.to_json(file_path, orient=orient, indent=indent, date_format='iso')
         print(f"✓ Saved {len(df)} rows to JSON: {file_path}")
     
     def save_to_database(
@@ -167,25 +716,39 @@ class DataSaver:
         df: pd.DataFrame,
         connection_string: str,
         table_name: str,
-        if_exists: str = 'append'
+        if_exists: str = 'append',
+        chunksize: Optional[int] = None,
+        method: Optional[Union[str, Callable]] = None
     ) -> None:
         """
         Save DataFrame to database
         
+        By default PostgreSQL is loaded with COPY in 100k-row chunks, SQLite
+        with plain executemany, and other databases (e.g. MySQL) with
+        multi-row INSERTs of 10k rows.
+        
         Args:
             df: DataFrame to save
             connection_string: Database connection string
             table_name: Target table name
             if_exists: How to behave if table exists ('fail', 'replace', 'append')
+            chunksize: Rows per insert batch (backend default if None)
+            method: DataFrame.to_sql insert method (backend default if None)
         """
-        engine = create_engine(connection_string)
+        engine = _get_engine(connection_string)
+        default_method, default_chunksize = _INSERT_DEFAULTS.get(
+            engine.url.get_backend_name(), ('multi', 10_000)
+        )
         
-        try:
-            df.to_sql(table_name, engine, if_exists=if_exists, index=False)
-            print(f"✓ Saved {len(df)} rows to database table: {table_name}")
-        
-        finally:
-            engine.dispose()
+        df.to_sql(
+            table_name,
+            engine,
+            if_exists=if_exists,
+            index=False,
+            method=method or default_method,
+            chunksize=chunksize or default_chunksize
+        )
+        print(f"✓ Saved {len(df)} rows to database table: {table_name}")
     
     def save_summary_stats(self, df: pd.DataFrame, file_path: str) -> None:
         """
@@ -195,6 +758,39 @@ class DataSaver:
             df: DataFrame with sentiment results
             file_path: Output file path
         """
+        sentiment_counts = None
+        if 'sentiment' in df.columns:
+            sentiment_counts = df['sentiment'].value_counts()
+            # Categorical columns also count labels that never occur
+            sentiment_counts = sentiment_counts[sentiment_counts > 0]
+        
+        # Reduce all score columns together as one float array
+        score_columns = [c for c in RunningSummary.SCORE_COLUMNS if c in df.columns]
+        stats = (
+            _score_stats(df[score_columns].to_numpy(dtype=np.float64, na_value=np.nan), score_columns)
+            if score_columns else pd.DataFrame()
+        )
+        
+        self._write_summary(file_path, sentiment_counts, stats, len(df))
+    
+    def save_running_summary(self, summary: 'RunningSummary', file_path: str) -> None:
+        """
+        Save summary statistics accumulated over streamed chunks to text file
+        
+        Args:
+            summary: Statistics accumulated with RunningSummary.update
+            file_path: Output file path
+        """
+        self._write_summary(file_path, summary.sentiment_counts(), summary.stats(), summary.total)
+    
+    def _write_summary(
+        self,
+        file_path: str,
+        sentiment_counts: Optional[pd.Series],
+        stats: pd.DataFrame,
+        total: int
+    ) -> None:
+        """Write the summary report; statistics missing from stats are skipped"""
         output_dir = Path(file_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -202,30 +798,109 @@ class DataSaver:
             f.write("Sentiment Analysis Summary\n")
             f.write("=" * 50 + "\n\n")
             
-            if 'sentiment' in df.columns:
-                sentiment_counts = df['sentiment'].value_counts()
+            if sentiment_counts is not None:
                 f.write("Sentiment Distribution:\n")
                 for sentiment, count in sentiment_counts.items():
-                    percentage = (count / len(df)) * 100
+                    percentage = (count / total) * 100
                     f.write(f"  {sentiment.capitalize()}: {count} ({percentage:.1f}%)\n")
                 f.write("\n")
             
-            if 'polarity' in df.columns:
+            if 'polarity' in stats:
+                polarity = stats['polarity']
                 f.write(f"Polarity Statistics:\n")
-                f.write(f"  Mean: {df['polarity'].mean():.4f}\n")
-                f.write(f"  Median: {df['polarity'].median():.4f}\n")
-                f.write(f"  Std Dev: {df['polarity'].std():.4f}\n")
-                f.write(f"  Min: {df['polarity'].min():.4f}\n")
-                f.write(f"  Max: {df['polarity'].max():.4f}\n")
+                f.write(f"  Mean: {polarity['mean']:.4f}\n")
+                if 'median' in polarity:
+                    f.write(f"  Median: {polarity['median']:.4f}\n")
+                f.write(f"  Std Dev: {polarity['std']:.4f}\n")
+                f.write(f"  Min: {polarity['min']:.4f}\n")
+                f.write(f"  Max: {polarity['max']:.4f}\n")
                 f.write("\n")
             
-            if 'subjectivity' in df.columns:
+            if 'subjectivity' in stats:
+                subjectivity = stats['subjectivity']
                 f.write(f"Subjectivity Statistics:\n")
-                f.write(f"  Mean: {df['subjectivity'].mean():.4f}\n")
-                f.write(f"  Median: {df['subjectivity'].median():.4f}\n")
-                f.write(f"  Std Dev: {df['subjectivity'].std():.4f}\n")
+                f.write(f"  Mean: {subjectivity['mean']:.4f}\n")
+                if 'median' in subjectivity:
+                    f.write(f"  Median: {subjectivity['median']:.4f}\n")
+                f.write(f"  Std Dev: {subjectivity['std']:.4f}\n")
             
             f.write("\n" + "=" * 50 + "\n")
-            f.write(f"Total Records Processed: {len(df)}\n")
+            f.write(f"Total Records Processed: {total}\n")
         
         print(f"✓ Saved summary statistics to: {file_path}")
+
+
+class RunningSummary:
+    """
+    Summary statistics accumulated chunk by chunk for streaming pipelines
+    
+    Keeps sentiment counts and per-column count/mean/M2/min/max (merged
+    with Chan's parallel variance formula), so no chunk has to be kept.
+    The median cannot be computed this way and is left out.
+    """
+    
+    SCORE_COLUMNS = ('polarity', 'subjectivity')
+    
+    def __init__(self):
+        """Initialize empty summary"""
+        self.total = 0
+        self._sentiment_counts: Optional[Counter] = None
+        self._scores: Dict[str, List[float]] = {}
+    
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Add a processed chunk to the summary
+        
+        Args:
+            df: DataFrame with sentiment results
+        """
+        self.total += len(df)
+        
+        if 'sentiment' in df.columns:
+            if self._sentiment_counts is None:
+                self._sentiment_counts = Counter()
+            counts = df['sentiment'].value_counts()
+            self._sentiment_counts.update(counts[counts > 0].to_dict())
+        
+        for column in self.SCORE_COLUMNS:
+            if column not in df.columns:
+                continue
+            values = df[column].dropna().to_numpy(dtype=float)
+            if len(values) == 0:
+                continue
+            
+            n_b, mean_b = len(values), values.mean()
+            m2_b = ((values - mean_b) ** 2).sum()
+            
+            if column not in self._scores:
+                self._scores[column] = [n_b, mean_b, m2_b, values.min(), values.max()]
+                continue
+            
+            n_a, mean_a, m2_a, low, high = self._scores[column]
+            n = n_a + n_b
+            delta = mean_b - mean_a
+            self._scores[column] = [
+                n,
+                mean_a + delta * n_b / n,
+                m2_a + m2_b + delta ** 2 * n_a * n_b / n,
+                min(low, values.min()),
+                max(high, values.max())
+            ]
+    
+    def sentiment_counts(self) -> Optional[pd.Series]:
+        """Sentiment label counts, most common first (None if no chunk had labels)"""
+        if self._sentiment_counts is None:
+            return None
+        return pd.Series(dict(self._sentiment_counts.most_common()), dtype='int64')
+    
+    def stats(self) -> pd.DataFrame:
+        """Mean, std, min and max per score column"""
+        return pd.DataFrame({
+            column: {
+                'mean': mean,
+                'std': np.sqrt(m2 / (n - 1)) if n > 1 else np.nan,
+                'min': low,
+                'max': high
+            }
+            for column, (n, mean, m2, low, high) in self._scores.items()
+        })
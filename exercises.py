@@ -11,6 +11,8 @@ Run this file and follow the instructions.
 import pandas as pd
 import sys
 import os
+import re
+from collections import Counter
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -85,19 +87,20 @@ print()
 print("Let's analyze each course separately:")
 print()
 
-for course in sorted(df['course_name'].unique()):
-    course_data = df[df['course_name'] == course]
-    
-    # Calculate statistics
-    total = len(course_data)
-    positive = (course_data['sentiment'] == 'positive').sum()
-    negative = (course_data['sentiment'] == 'negative').sum()
-    neutral = (course_data['sentiment'] == 'neutral').sum()
-    avg_polarity = course_data['polarity'].mean()
-    avg_rating = course_data['rating'].mean()
-    
+# Calculate statistics for every course in one pass (groups come out sorted)
+course_stats = df.groupby('course_name').agg(
+    total=('sentiment', 'size'),
+    avg_polarity=('polarity', 'mean'),
+    avg_rating=('rating', 'mean'),
+)
+sentiment_counts_by_course = pd.crosstab(df['course_name'], df['sentiment'])
+course_stats = course_stats.join(
+    sentiment_counts_by_course.reindex(columns=['positive', 'negative', 'neutral'], fill_value=0)
+)
+course_stats['negative_pct'] = course_stats['negative'] / course_stats['total'] * 100
+
+for course, total, avg_polarity, avg_rating, positive, negative, neutral, negative_pct in course_stats.itertuples():
     # Determine status
-    negative_pct = (negative / total) * 100
     if negative_pct > 30:
         status = "🚨 NEEDS ATTENTION"
     elif negative_pct < 15 and avg_polarity > 0.3:
@@ -127,30 +130,34 @@ print("="*60)
 print()
 
 # Get negative feedback
-negative_feedback = df[df['sentiment'] == 'negative'].sort_values('polarity')
+negative_feedback = df[df['sentiment'] == 'negative']
+# Only the five lowest scores are shown, so skip sorting the rest
+most_negative = negative_feedback.nsmallest(5, 'polarity')
 
 print("🔍 Most Negative Feedback (Top 5):")
 print()
-for idx, row in negative_feedback.head(5).iterrows():
-    print(f"📝 {row['course_name']} (Student {row['student_id']})")
-    print(f"   Rating: {row['rating']}/5 | Polarity: {row['polarity']:.3f}")
-    print(f"   Feedback: {row['feedback'][:100]}...")
+for row in most_negative.assign(snippet=most_negative['feedback'].str[:100]).itertuples(index=False):
+    print(f"📝 {row.course_name} (Student {row.student_id})")
+    print(f"   Rating: {row.rating}/5 | Polarity: {row.polarity:.3f}")
+    print(f"   Feedback: {row.snippet}...")
     print()
 
 # Common keywords in negative feedback
 print("🔍 Common words in negative feedback:")
-from collections import Counter
-import re
 
-negative_text = ' '.join(negative_feedback['feedback'].str.lower())
-words = re.findall(r'\b\w+\b', negative_text)
+# Lowercase once and join the plain array (keywords never span lines)
+negative_text = '\n'.join(negative_feedback['feedback'].str.lower().to_numpy())
 
 # Common complaint words
 complaint_words = ['difficult', 'confusing', 'bad', 'terrible', 'poor', 'frustrating', 
                    'disappointing', 'unclear', 'outdated', 'buggy', 'slow', 'fast',
                    'boring', 'waste', 'hard']
 
-found_complaints = [(word, negative_text.count(word)) for word in complaint_words if word in negative_text]
+# Count every keyword in a single scan of the text
+complaint_pattern = re.compile('|'.join(map(re.escape, complaint_words)))
+complaint_counts = Counter(complaint_pattern.findall(negative_text))
+
+found_complaints = [(word, complaint_counts[word]) for word in complaint_words if complaint_counts[word]]
 found_complaints.sort(key=lambda x: x[1], reverse=True)
 
 for word, count in found_complaints[:10]:
@@ -169,25 +176,29 @@ print("="*60)
 print()
 
 # Get highly positive feedback
-positive_feedback = df[df['sentiment'] == 'positive'].sort_values('polarity', ascending=False)
+positive_feedback = df[df['sentiment'] == 'positive']
+most_positive = positive_feedback.nlargest(5, 'polarity')
 
 print("⭐ Most Positive Feedback (Top 5):")
 print()
-for idx, row in positive_feedback.head(5).iterrows():
-    print(f"📝 {row['course_name']} (Student {row['student_id']})")
-    print(f"   Rating: {row['rating']}/5 | Polarity: {row['polarity']:.3f}")
-    print(f"   Feedback: {row['feedback'][:100]}...")
+for row in most_positive.assign(snippet=most_positive['feedback'].str[:100]).itertuples(index=False):
+    print(f"📝 {row.course_name} (Student {row.student_id})")
+    print(f"   Rating: {row.rating}/5 | Polarity: {row.polarity:.3f}")
+    print(f"   Feedback: {row.snippet}...")
     print()
 
 # Success keywords
 print("⭐ Common words in positive feedback:")
-positive_text = ' '.join(positive_feedback['feedback'].str.lower())
+positive_text = '\n'.join(positive_feedback['feedback'].str.lower().to_numpy())
 
 success_words = ['excellent', 'amazing', 'fantastic', 'great', 'love', 'best',
                  'wonderful', 'perfect', 'brilliant', 'outstanding', 'clear',
                  'helpful', 'engaging', 'practical', 'learned']
 
-found_success = [(word, positive_text.count(word)) for word in success_words if word in positive_text]
+success_pattern = re.compile('|'.join(map(re.escape, success_words)))
+success_counts = Counter(success_pattern.findall(positive_text))
+
+found_success = [(word, success_counts[word]) for word in success_words if success_counts[word]]
 found_success.sort(key=lambda x: x[1], reverse=True)
 
 for word, count in found_success[:10]:
@@ -208,11 +219,16 @@ print()
 print("Based on our analysis, here are recommended actions:")
 print()
 
-for course in sorted(df['course_name'].unique()):
-    course_data = df[df['course_name'] == course]
-    negative_pct = (course_data['sentiment'] == 'negative').mean() * 100
-    avg_polarity = course_data['polarity'].mean()
-    
+# First few negative comments per course, in file order
+negative_examples = (
+    df[df['sentiment'] == 'negative']
+    .groupby('course_name')
+    .head(3)
+    .groupby('course_name')['feedback']
+    .apply(list)
+)
+
+for course, negative_pct, avg_polarity in course_stats[['negative_pct', 'avg_polarity']].itertuples():
     print(f"📚 {course}")
     print(f"   Negative Feedback: {negative_pct:.1f}%")
     print(f"   Average Sentiment: {avg_polarity:+.3f}")
@@ -237,13 +253,13 @@ for course in sorted(df['course_name'].unique()):
         print("   3. Use positive feedback for testimonials")
     
     # Specific issues
-    course_negative = course_data[course_data['sentiment'] == 'negative']
+    course_negative = negative_examples.get(course, [])
     if len(course_negative) > 0:
         print()
         print("   🔍 Specific Issues to Address:")
-        for idx, row in course_negative.head(3).iterrows():
+        for feedback in course_negative:
             # Extract key issue
-            feedback_lower = row['feedback'].lower()
+            feedback_lower = feedback.lower()
             if 'pace' in feedback_lower or 'fast' in feedback_lower or 'slow' in feedback_lower:
                 print("   - Review course pacing")
             if 'confusing' in feedback_lower or 'unclear' in feedback_lower:
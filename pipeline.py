@@ -1,13 +1,17 @@
 """
 NLP Pipeline - Orchestrates data loading, processing, and saving
 """
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List
+import functools
 import logging
+import os
+import time
+from pathlib import Path
 
-from sentiment_analyzer import SentimentAnalyzer
-from data_handler import DataLoader, DataSaver
+from data_handler import DataLoader, DataSaver, RunningSummary
 
 # Configure logging
 logging.basicConfig(
@@ -16,23 +20,88 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Categories of the sentiment column, in SentimentAnalyzer.label_codes
+# order; rows without text are 'unknown'
+SENTIMENT_CATEGORIES = ['positive', 'neutral', 'negative', 'unknown']
+UNKNOWN_CODE = SENTIMENT_CATEGORIES.index('unknown')
+
+# Minimum seconds between progress messages in streaming pipelines
+PROGRESS_LOG_INTERVAL = 1.0
+
+
+def _log_progress(chunks: Iterator[pd.DataFrame], label: str) -> Iterator[pd.DataFrame]:
+    """Yield chunks, logging the running row count at most once per PROGRESS_LOG_INTERVAL"""
+    rows = 0
+    last_log = time.monotonic()
+    for chunk in chunks:
+        yield chunk
+        rows += len(chunk)
+        now = time.monotonic()
+        if now - last_log >= PROGRESS_LOG_INTERVAL:
+            logger.info("%s: processed %s rows", label, rows)
+            last_log = now
+
+
+def _shuts_down_executor(run):
+    """Shut the pipeline's worker pool down when a run method returns or raises"""
+    @functools.wraps(run)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return run(self, *args, **kwargs)
+        finally:
+            self.close()
+    return wrapper
+
 
 class SentimentPipeline:
     """End-to-end sentiment analysis pipeline"""
     
-    def __init__(self):
-        """Initialize pipeline components"""
-        self.analyzer = SentimentAnalyzer()
+    def __init__(self, n_workers: Optional[int] = None):
+        """
+        Initialize pipeline components
+        
+        Args:
+            n_workers: Processes used to score large batches (all cores if None)
+        """
+        if n_workers is not None and n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self._analyzer = None
+        self._executor = None
         self.loader = DataLoader()
         self.saver = DataSaver()
         logger.info("Pipeline initialized")
     
+    @property
+    def analyzer(self):
+        """Sentiment analyzer, created (and TextBlob/NLTK imported) on first use"""
+        if self._analyzer is None:
+            from sentiment_analyzer import SentimentAnalyzer
+            self._analyzer = SentimentAnalyzer()
+        return self._analyzer
+    
+    @property
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        """Worker pool shared by every batch of a run, started on first use (None for one worker)"""
+        if self._executor is None and self.n_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the worker pool; the next run starts a new one"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    @_shuts_down_executor
     def run_csv_pipeline(
         self,
         input_csv: str,
         output_csv: str,
         text_column: str,
-        save_summary: bool = True
+        save_summary: bool = True,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None
     ) -> pd.DataFrame:
         """
         Run complete pipeline for CSV input/output
@@ -42,14 +111,16 @@ class SentimentPipeline:
             output_csv: Path to output CSV file
             text_column: Name of column containing text to analyze
             save_summary: Whether to save summary statistics
+            usecols: Input columns to keep (text column is always kept); all if None
+            dtype: Input column dtypes, skipping type inference for them
             
         Returns:
             DataFrame with sentiment analysis results
         """
-        logger.info(f"Starting CSV pipeline: {input_csv} -> {output_csv}")
+        logger.info("Starting CSV pipeline: %s -> %s", input_csv, output_csv)
         
         # Load data
-        df = self.loader.load_from_csv(input_csv, text_column)
+        df = self.loader.load_from_csv(input_csv, text_column, usecols=usecols, dtype=dtype)
         
         # Process data
         df = self._process_dataframe(df, text_column)
@@ -58,12 +129,58 @@ class SentimentPipeline:
         self.saver.save_to_csv(df, output_csv)
         
         if save_summary:
-            summary_path = output_csv.replace('.csv', '_summary.txt')
+            summary_path = self._summary_path_for(output_csv)
             self.saver.save_summary_stats(df, summary_path)
         
         logger.info("CSV pipeline completed successfully")
         return df
     
+    @_shuts_down_executor
+    def run_csv_pipeline_streaming(
+        self,
+        input_csv: str,
+        output_csv: str,
+        text_column: str,
+        chunksize: int = 100_000,
+        usecols: Optional[List[str]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        save_summary: bool = True
+    ) -> RunningSummary:
+        """
+        Run CSV pipeline chunk by chunk so memory stays bounded by chunksize
+        
+        Args:
+            input_csv: Path to input CSV file
+            output_csv: Path to output CSV file
+            text_column: Name of column containing text to analyze
+            chunksize: Number of rows loaded, analyzed and written at a time
+            usecols: Input columns to keep (text column is always kept); all if None
+            dtype: Input column dtypes, skipping type inference for them
+            save_summary: Whether to save summary statistics (without medians)
+            
+        Returns:
+            RunningSummary with the row count, sentiment counts and score statistics
+        """
+        logger.info("Starting streaming CSV pipeline: %s -> %s", input_csv, output_csv)
+        
+        summary = RunningSummary()
+        chunks = self.loader.load_from_csv_chunks(
+            input_csv, text_column, chunksize, usecols=usecols, dtype=dtype
+        )
+        for i, chunk in enumerate(_log_progress(chunks, input_csv)):
+            chunk = self._process_dataframe(chunk, text_column)
+            # One writer for every chunk keeps the file's formatting uniform
+            self.saver.save_to_csv(chunk, output_csv, append=i > 0, parallel=False)
+            summary.update(chunk)
+        
+        if save_summary:
+            summary_path = self._summary_path_for(output_csv)
+            self.saver.save_running_summary(summary, summary_path)
+        
+        logger.info("Streaming CSV pipeline completed successfully: %s rows", summary.total)
+        return summary
+    
+    @_shuts_down_executor
     def run_json_pipeline(
         self,
         input_json: str,
@@ -83,7 +200,7 @@ class SentimentPipeline:
         Returns:
             DataFrame with sentiment analysis results
         """
-        logger.info(f"Starting JSON pipeline: {input_json} -> {output_json}")
+        logger.info("Starting JSON pipeline: %s -> %s", input_json, output_json)
         
         # Load data
         df = self.loader.load_from_json(input_json, text_field)
@@ -95,12 +212,51 @@ class SentimentPipeline:
         self.saver.save_to_json(df, output_json)
         
         if save_summary:
-            summary_path = output_json.replace('.json', '_summary.txt')
+            summary_path = self._summary_path_for(output_json)
             self.saver.save_summary_stats(df, summary_path)
         
         logger.info("JSON pipeline completed successfully")
         return df
     
+    @_shuts_down_executor
+    def run_json_pipeline_streaming(
+        self,
+        input_json: str,
+        output_json: str,
+        text_field: str,
+        chunksize: int = 100_000,
+        save_summary: bool = True
+    ) -> RunningSummary:
+        """
+        Run JSON Lines pipeline chunk by chunk so memory stays bounded by chunksize
+        
+        Args:
+            input_json: Path to input JSON Lines file
+            output_json: Path to output JSON Lines file
+            text_field: Name of field containing text to analyze
+            chunksize: Number of rows loaded, analyzed and written at a time
+            save_summary: Whether to save summary statistics (without medians)
+            
+        Returns:
+            RunningSummary with the row count, sentiment counts and score statistics
+        """
+        logger.info("Starting streaming JSON pipeline: %s -> %s", input_json, output_json)
+        
+        summary = RunningSummary()
+        chunks = self.loader.load_from_json_chunks(input_json, text_field, chunksize)
+        for i, chunk in enumerate(_log_progress(chunks, input_json)):
+            chunk = self._process_dataframe(chunk, text_field)
+            self.saver.save_to_json(chunk, output_json, lines=True, append=i > 0)
+            summary.update(chunk)
+        
+        if save_summary:
+            summary_path = self._summary_path_for(output_json)
+            self.saver.save_running_summary(summary, summary_path)
+        
+        logger.info("Streaming JSON pipeline completed successfully: %s rows", summary.total)
+        return summary
+    
+    @_shuts_down_executor
     def run_database_pipeline(
         self,
         source_connection: str,
@@ -113,6 +269,9 @@ class SentimentPipeline:
         """
         Run complete pipeline for database input/output
         
+        The whole query result is held in memory. Use
+        run_database_pipeline_streaming for large results.
+        
         Args:
             source_connection: Source database connection string
             source_query: SQL query to load data
@@ -124,7 +283,7 @@ class SentimentPipeline:
         Returns:
             DataFrame with sentiment analysis results
         """
-        logger.info(f"Starting database pipeline: {dest_table}")
+        logger.info("Starting database pipeline: %s", dest_table)
         
         # Load data
         df = self.loader.load_from_database(source_connection, source_query, text_column)
@@ -138,6 +297,49 @@ class SentimentPipeline:
         logger.info("Database pipeline completed successfully")
         return df
     
+    @_shuts_down_executor
+    def run_database_pipeline_streaming(
+        self,
+        source_connection: str,
+        source_query: str,
+        dest_connection: str,
+        dest_table: str,
+        text_column: str,
+        if_exists: str = 'append',
+        chunksize: int = 50_000
+    ) -> RunningSummary:
+        """
+        Run database pipeline chunk by chunk so memory stays bounded by chunksize
+        
+        Args:
+            source_connection: Source database connection string
+            source_query: SQL query to load data
+            dest_connection: Destination database connection string
+            dest_table: Destination table name
+            text_column: Name of column containing text to analyze
+            if_exists: How to behave if table exists (applies to the first chunk)
+            chunksize: Number of rows loaded, analyzed and written at a time
+            
+        Returns:
+            RunningSummary with the row count, sentiment counts and score statistics
+        """
+        logger.info("Starting streaming database pipeline: %s", dest_table)
+        
+        summary = RunningSummary()
+        chunks = self.loader.load_from_database_chunks(
+            source_connection, source_query, text_column, chunksize
+        )
+        for i, chunk in enumerate(_log_progress(chunks, dest_table)):
+            chunk = self._process_dataframe(chunk, text_column)
+            self.saver.save_to_database(
+                chunk, dest_connection, dest_table, if_exists if i == 0 else 'append'
+            )
+            summary.update(chunk)
+        
+        logger.info("Streaming database pipeline completed successfully: %s rows", summary.total)
+        return summary
+    
+    @_shuts_down_executor
     def run_custom_pipeline(
         self,
         df: pd.DataFrame,
@@ -153,13 +355,13 @@ class SentimentPipeline:
             df: Input DataFrame
             text_column: Name of column containing text to analyze
             output_path: Path to save output
-            output_format: Output format ('csv' or 'json')
+            output_format: Output format ('csv', 'json', 'parquet' or 'feather')
             save_summary: Whether to save summary statistics
             
         Returns:
             DataFrame with sentiment analysis results
         """
-        logger.info(f"Starting custom pipeline with {len(df)} rows")
+        logger.info("Starting custom pipeline with %s rows", len(df))
         
         # Process data
         df = self._process_dataframe(df, text_column)
@@ -169,16 +371,26 @@ class SentimentPipeline:
             self.saver.save_to_csv(df, output_path)
         elif output_format == 'json':
             self.saver.save_to_json(df, output_path)
+        elif output_format == 'parquet':
+            self.saver.save_to_parquet(df, output_path)
+        elif output_format == 'feather':
+            self.saver.save_to_feather(df, output_path)
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
         
         if save_summary:
-            summary_path = output_path.rsplit('.', 1)[0] + '_summary.txt'
+            summary_path = self._summary_path_for(output_path)
             self.saver.save_summary_stats(df, summary_path)
         
         logger.info("Custom pipeline completed successfully")
         return df
     
+    @staticmethod
+    def _summary_path_for(output_path: str) -> str:
+        """Return the summary file path next to an output file (out.csv -> out_summary.txt)"""
+        output = Path(output_path)
+        return str(output.with_name(output.stem + '_summary.txt'))
+    
     def _process_dataframe(self, df: pd.DataFrame, text_column: str) -> pd.DataFrame:
         """
         Process DataFrame with sentiment analysis
@@ -190,39 +402,54 @@ class SentimentPipeline:
         Returns:
             DataFrame with added sentiment columns
         """
-        logger.info(f"Processing {len(df)} texts...")
-        
-        # Add timestamp
-        df['processed_at'] = datetime.now().isoformat()
-        
-        # Analyze sentiment for each row
-        results = []
-        for idx, text in enumerate(df[text_column], 1):
-            if pd.isna(text) or text.strip() == '':
-                results.append({
-                    'sentiment': 'unknown',
-                    'polarity': 0.0,
-                    'subjectivity': 0.0
-                })
-                logger.warning(f"Row {idx}: Empty or null text")
-            else:
-                result = self.analyzer.analyze_sentiment(str(text))
-                results.append({
-                    'sentiment': result['label'],
-                    'polarity': result['polarity'],
-                    'subjectivity': result['subjectivity']
-                })
-            
-            # Progress logging
-            if idx % 100 == 0:
-                logger.info(f"Processed {idx}/{len(df)} rows")
+        logger.info("Processing %s texts...", len(df))
+        
+        # Add timestamp (one datetime64 value broadcast to every row)
+        df['processed_at'] = pd.Timestamp.now()
+        
+        # Only non-empty texts go to the analyzer, in a single batch. Converting
+        # to the string dtype once keeps nulls as NA for the vectorized check
+        text = df[text_column]
+        if not isinstance(text.dtype, pd.StringDtype):
+            text = text.astype('string')
+        mask = text.str.strip().str.len().fillna(0).gt(0).to_numpy(dtype=bool)
+        
+        # Score each distinct text once and gather results back by code. The
+        # uniques stay a Series so Arrow-backed text is preprocessed as Arrow
+        codes, unique_texts = pd.factorize(text[mask])
+        batch = self.analyzer.batch_analyze(
+            pd.Series(unique_texts), n_jobs=self.n_workers, executor=self.executor
+        )
+        
+        # Turn the result dicts into columns in one pass
+        records = pd.DataFrame.from_records(batch, columns=['polarity', 'subjectivity'])
+        label_codes = self.analyzer.label_codes(records['polarity'].to_numpy())
+        
+        # Empty or null rows keep the 'unknown' defaults
+        sentiment = np.full(len(df), UNKNOWN_CODE, dtype=np.int8)
+        polarity = np.zeros(len(df))
+        subjectivity = np.zeros(len(df))
+        sentiment[mask] = label_codes[codes]
+        polarity[mask] = records['polarity'].to_numpy()[codes]
+        subjectivity[mask] = records['subjectivity'].to_numpy()[codes]
+        
+        empty_count = len(df) - len(codes)
+        if empty_count:
+            logger.warning("%s/%s rows had empty or null text", empty_count, len(df))
         
         # Add results to dataframe
-        df['sentiment'] = [r['sentiment'] for r in results]
-        df['polarity'] = [r['polarity'] for r in results]
-        df['subjectivity'] = [r['subjectivity'] for r in results]
+        df['sentiment'] = pd.Categorical.from_codes(sentiment, categories=SENTIMENT_CATEGORIES)
+        df['polarity'] = polarity
+        df['subjectivity'] = subjectivity
         
-        logger.info(f"Processing complete. Sentiment distribution: {df['sentiment'].value_counts().to_dict()}")
+        if logger.isEnabledFor(logging.INFO):
+            # Count the int8 codes directly rather than grouping the column
+            counts = np.bincount(sentiment, minlength=len(SENTIMENT_CATEGORIES))
+            distribution = {
+                SENTIMENT_CATEGORIES[code]: int(counts[code])
+                for code in np.argsort(-counts, kind='stable') if counts[code]
+            }
+            logger.info("Processing complete. Sentiment distribution: %s", distribution)
         
         return df
 
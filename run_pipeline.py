@@ -12,10 +12,38 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from pipeline import SentimentPipeline
 from dotenv import load_dotenv
+from sqlalchemy import make_url
 
 # Load environment variables
 load_dotenv()
 
+# File output formats chosen from the output file suffix
+OUTPUT_SUFFIXES = {
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'json',
+    '.parquet': 'parquet',
+    '.feather': 'feather',
+    '.fhr': 'feather'
+}
+
+# Rows per chunk for database sources, which stream unless reading from
+# the destination database
+DATABASE_CHUNKSIZE = 50_000
+
+
+def same_database(source: str, destination: str) -> bool:
+    """True if both connection strings point at the same database"""
+    return make_url(source) == make_url(destination)
+
+
+def positive_int(value: str) -> int:
+    """argparse type accepting integers of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -24,7 +52,7 @@ def main():
     
     parser.add_argument(
         '--source-type',
-        choices=['csv', 'json', 'postgres', 'mysql'],
+        choices=['csv', 'json', 'parquet', 'postgres', 'mysql'],
         required=True,
         help='Type of data source'
     )
@@ -49,8 +77,9 @@ def main():
     
     parser.add_argument(
         '--output-type',
-        choices=['csv', 'json', 'postgres', 'mysql'],
-        help='Type of output destination (defaults to same as source-type)'
+        choices=['csv', 'json', 'parquet', 'feather', 'postgres', 'mysql'],
+        help='Type of output destination (defaults to the output file suffix, '
+             'then to same as source-type)'
     )
     
     parser.add_argument(
@@ -70,6 +99,27 @@ def main():
         help='How to behave if output table exists (default: append)'
     )
     
+    parser.add_argument(
+        '--only-text-column',
+        action='store_true',
+        help='Only read the text column from CSV and Parquet sources (other columns are dropped from output)'
+    )
+    
+    parser.add_argument(
+        '--chunksize',
+        type=positive_int,
+        help='Stream the source in chunks of this many rows instead of loading it whole '
+             '(CSV and JSON Lines sources; summaries omit medians). Database sources '
+             f'stream {DATABASE_CHUNKSIZE} rows at a time by default, unless the '
+             'destination is the same database, whose query results are loaded whole'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        help='Worker processes for sentiment scoring of large inputs (default: all cores)'
+    )
+    
     parser.add_argument(
         '--no-summary',
         action='store_true',
@@ -78,28 +128,79 @@ def main():
     
     args = parser.parse_args()
     
+    # Restrict CSV/Parquet reads to the text column if requested
+    usecols = [args.text_column] if args.only_text_column else None
+    
     # Initialize pipeline
-    pipeline = SentimentPipeline()
+    pipeline = SentimentPipeline(n_workers=args.workers)
     
     # Determine output type
-    output_type = args.output_type or args.source_type
+    output_type = (
+        args.output_type
+        or OUTPUT_SUFFIXES.get(Path(args.output).suffix.lower())
+        or args.source_type
+    )
+    
+    # Streaming runs return running statistics instead of a result DataFrame
+    results = None
+    summary = None
     
     try:
         # Run appropriate pipeline
-        if args.source_type == 'csv':
-            if output_type == 'csv':
-                results = pipeline.run_csv_pipeline(
+        if args.source_type == 'parquet' or (
+            args.source_type in ['csv', 'json'] and output_type in ['parquet', 'feather']
+        ):
+            if output_type not in ['csv', 'json', 'parquet', 'feather']:
+                print("Error: Parquet source currently only supports CSV, JSON, Parquet or Feather output")
+                sys.exit(1)
+            
+            if args.source_type == 'csv':
+                df = pipeline.loader.load_from_csv(args.source, args.text_column, usecols=usecols)
+            elif args.source_type == 'json':
+                df = pipeline.loader.load_from_json(args.source, args.text_column)
+            else:
+                df = pipeline.loader.load_from_parquet(args.source, args.text_column, usecols=usecols)
+            
+            results = pipeline.run_custom_pipeline(
+                df=df,
+                text_column=args.text_column,
+                output_path=args.output,
+                output_format=output_type,
+                save_summary=not args.no_summary
+            )
+        
+        elif args.source_type == 'csv':
+            if output_type == 'csv' and args.chunksize:
+                summary = pipeline.run_csv_pipeline_streaming(
                     input_csv=args.source,
                     output_csv=args.output,
                     text_column=args.text_column,
+                    chunksize=args.chunksize,
+                    usecols=usecols,
                     save_summary=not args.no_summary
                 )
+            elif output_type == 'csv':
+                results = pipeline.run_csv_pipeline(
+                    input_csv=args.source,
+                    output_csv=args.output,
+                    text_column=args.text_column,
+                    save_summary=not args.no_summary,
+                    usecols=usecols
+                )
             else:
-                print("Error: CSV source currently only supports CSV output")
+                print("Error: CSV source currently only supports CSV, Parquet or Feather output")
                 sys.exit(1)
         
         elif args.source_type == 'json':
-            if output_type == 'json':
+            if output_type == 'json' and args.chunksize:
+                summary = pipeline.run_json_pipeline_streaming(
+                    input_json=args.source,
+                    output_json=args.output,
+                    text_field=args.text_column,
+                    chunksize=args.chunksize,
+                    save_summary=not args.no_summary
+                )
+            elif output_type == 'json':
                 results = pipeline.run_json_pipeline(
                     input_json=args.source,
                     output_json=args.output,
@@ -107,7 +208,7 @@ def main():
                     save_summary=not args.no_summary
                 )
             else:
-                print("Error: JSON source currently only supports JSON output")
+                print("Error: JSON source currently only supports JSON, Parquet or Feather output")
                 sys.exit(1)
         
         elif args.source_type in ['postgres', 'mysql']:
@@ -123,19 +224,47 @@ def main():
                 print("Error: --table required for database output")
                 sys.exit(1)
             
-            results = pipeline.run_database_pipeline(
-                source_connection=args.source,
-                source_query=args.query,
-                dest_connection=args.output,
-                dest_table=args.table,
-                text_column=args.text_column,
-                if_exists=args.if_exists
-            )
+            # An open streaming cursor blocks writes (and DROP for --if-exists
+            # replace) on the database it reads from, so load those results first
+            if same_database(args.source, args.output):
+                if args.chunksize:
+                    print("Error: --chunksize cannot stream a database into itself")
+                    sys.exit(1)
+                
+                results = pipeline.run_database_pipeline(
+                    source_connection=args.source,
+                    source_query=args.query,
+                    dest_connection=args.output,
+                    dest_table=args.table,
+                    text_column=args.text_column,
+                    if_exists=args.if_exists
+                )
+            else:
+                summary = pipeline.run_database_pipeline_streaming(
+                    source_connection=args.source,
+                    source_query=args.query,
+                    dest_connection=args.output,
+                    dest_table=args.table,
+                    text_column=args.text_column,
+                    if_exists=args.if_exists,
+                    chunksize=args.chunksize or DATABASE_CHUNKSIZE
+                )
+        
+        if results is not None:
+            total = len(results)
+            sentiment_counts = results['sentiment'].value_counts()
+            sentiment_counts = sentiment_counts[sentiment_counts > 0]
+        else:
+            total = summary.total
+            sentiment_counts = summary.sentiment_counts()
+            if sentiment_counts is not None:
+                sentiment_counts = sentiment_counts.rename_axis('sentiment').rename('count')
         
         print(f"\n✅ Pipeline completed successfully!")
-        print(f"Processed {len(results)} records")
-        print(f"\nSentiment distribution:")
-        print(results['sentiment'].value_counts())
+        print(f"Processed {total} records")
+        if sentiment_counts is not None:
+            print(f"\nSentiment distribution:")
+            print(sentiment_counts)
         
     except Exception as e:
         print(f"\n❌ Error: {str(e)}", file=sys.stderr)
@@ -1,29 +1,91 @@
 """
 Simple sentiment analysis using NLTK and TextBlob
 """
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+
 import nltk
+import numpy as np
+import pandas as pd
 from textblob import TextBlob
-from typing import Dict, List
+from textblob.en import sentiment as pattern_lexicon
+from typing import Dict, List, Optional, Tuple, Union
 import re
 
 
+_URL_RE = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+_PUNCT_RE = re.compile(r'[^\w\s.,!?]')
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+# Batches smaller than this are scored in-process; pool start-up would dominate
+PARALLEL_MIN_TEXTS = 2000
+
+# Sentiment labels indexed by the codes SentimentAnalyzer.label_codes returns
+SENTIMENT_LABELS = np.array(['positive', 'neutral', 'negative'], dtype=object)
+
+@lru_cache(maxsize=100_000)
+def _score(cleaned_text: str) -> Tuple[float, float]:
+    """TextBlob (polarity, subjectivity) of cleaned text, memoized for duplicates"""
+    sentiment = TextBlob(cleaned_text).sentiment
+    return sentiment.polarity, sentiment.subjectivity
+
+
+# Set once the punkt tokenizer has been found or downloaded in this process
+_punkt_ready = False
+
+
+def _ensure_punkt() -> None:
+    """Make sure NLTK's punkt tokenizer is available, probing only once"""
+    global _punkt_ready
+    if _punkt_ready:
+        return
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+    _punkt_ready = True
+
+
+# Analyzer reused by every chunk a pool worker scores
+_worker_analyzer = None
+
+
+def _analyze_chunk(cleaned_texts: List[str]) -> List[Dict[str, float]]:
+    """Score a chunk of preprocessed texts inside a pool worker"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentAnalyzer()
+    return [_worker_analyzer.analyze_preprocessed(text) for text in cleaned_texts]
+
+
 class SentimentAnalyzer:
+    # Word lexicon shared by all instances, built on first fast batch call
+    _lexicon: Optional[Tuple[pd.Index, np.ndarray]] = None
+
     def __init__(self):
         """Initialize the sentiment analyzer"""
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
+        _ensure_punkt()
         
     def preprocess_text(self, text: str) -> str:
         """Clean and preprocess text"""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?]', '', text)
-        return text.strip()
+        # Lowercase, remove URLs, remove special characters but keep basic punctuation
+        return _PUNCT_RE.sub('', _URL_RE.sub('', text.lower())).strip()
+    
+    def preprocess_series(self, texts: pd.Series) -> pd.Series:
+        """
+        Clean and preprocess a whole Series of texts at once
+        
+        Lowercasing and stripping run as Arrow kernels on string[pyarrow]
+        Series. The regex replacements stay on Python's engine because
+        Arrow's RE2 \\w only matches ASCII and would drop accented letters.
+        """
+        return (
+            texts.str.lower()
+            .str.replace(_URL_RE, '', regex=True)
+            .str.replace(_PUNCT_RE, '', regex=True)
+            .str.strip()
+        )
     
     def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """
@@ -32,13 +94,16 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with polarity and subjectivity scores
         """
-        cleaned_text = self.preprocess_text(text)
-        blob = TextBlob(cleaned_text)
+        return self.analyze_preprocessed(self.preprocess_text(text))
+    
+    def analyze_preprocessed(self, cleaned_text: str) -> Dict[str, float]:
+        """Analyze sentiment of text already cleaned by preprocess_text/preprocess_series"""
+        polarity, subjectivity = _score(cleaned_text)
         
         return {
-            'polarity': blob.sentiment.polarity,  # -1 to 1
-            'subjectivity': blob.sentiment.subjectivity,  # 0 to 1
-            'label': self._get_sentiment_label(blob.sentiment.polarity)
+            'polarity': polarity,  # -1 to 1
+            'subjectivity': subjectivity,  # 0 to 1
+            'label': self._get_sentiment_label(polarity)
         }
     
     def _get_sentiment_label(self, polarity: float) -> str:
@@ -50,9 +115,95 @@ class SentimentAnalyzer:
         else:
             return 'neutral'
     
-    def batch_analyze(self, texts: List[str]) -> List[Dict[str, float]]:
-        """Analyze sentiment for multiple texts"""
-        return [self.analyze_sentiment(text) for text in texts]
+    @staticmethod
+    def label_codes(polarity: np.ndarray) -> np.ndarray:
+        """Vectorized _get_sentiment_label: int8 codes into SENTIMENT_LABELS"""
+        polarity = np.asarray(polarity)
+        codes = np.ones(polarity.shape, dtype=np.int8)
+        codes[polarity > 0.1] = 0
+        codes[polarity < -0.1] = 2
+        return codes
+    
+    def batch_analyze(
+        self,
+        texts: Union[List[str], pd.Series],
+        n_jobs: Optional[int] = None,
+        chunk_size: int = 512,
+        executor: Optional[Executor] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Analyze sentiment for multiple texts
+        
+        Batches of at least PARALLEL_MIN_TEXTS texts are split into chunks
+        and scored across n_jobs worker processes (all cores if None). Pass
+        an executor to reuse one pool across calls; the caller shuts it down,
+        otherwise a pool is started and stopped for this batch.
+        
+        A Series is preprocessed in its own dtype, so string[pyarrow] texts
+        keep the Arrow kernels of preprocess_series; lists are wrapped in an
+        object Series.
+        """
+        if not isinstance(texts, pd.Series):
+            texts = pd.Series(texts, dtype=object)
+        cleaned = self.preprocess_series(texts).tolist()
+        n_jobs = n_jobs or os.cpu_count() or 1
+        
+        if n_jobs == 1 or len(cleaned) < PARALLEL_MIN_TEXTS:
+            return [self.analyze_preprocessed(text) for text in cleaned]
+        
+        chunks = [cleaned[i:i + chunk_size] for i in range(0, len(cleaned), chunk_size)]
+        if executor is not None:
+            return [result for chunk in executor.map(_analyze_chunk, chunks) for result in chunk]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return [result for chunk in executor.map(_analyze_chunk, chunks) for result in chunk]
+    
+    def batch_analyze_fast(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Analyze sentiment for multiple texts with a vectorized lexicon scorer
+        
+        Averages TextBlob lexicon scores over the words found in each text
+        instead of building a TextBlob per text. Negations and intensifiers
+        are ignored, so scores approximate those of analyze_sentiment.
+        """
+        if not texts:
+            return []
+        
+        words, scores = self._get_lexicon()
+        cleaned = self.preprocess_series(pd.Series(texts, dtype=object))
+        
+        # One row per token, indexed by the position of its source text
+        tokens = cleaned.str.findall(_TOKEN_RE).explode().dropna()
+        codes = words.get_indexer(tokens.to_numpy())
+        hits = codes >= 0
+        rows = tokens.index.to_numpy()[hits]
+        matched = scores[codes[hits]]
+        
+        n = len(texts)
+        counts = np.bincount(rows, minlength=n)
+        polarity = np.bincount(rows, weights=matched[:, 0], minlength=n)
+        subjectivity = np.bincount(rows, weights=matched[:, 1], minlength=n)
+        np.divide(polarity, counts, out=polarity, where=counts > 0)
+        np.divide(subjectivity, counts, out=subjectivity, where=counts > 0)
+        
+        labels = SENTIMENT_LABELS[self.label_codes(polarity)]
+        
+        return [
+            {'polarity': p, 'subjectivity': s, 'label': label}
+            for p, s, label in zip(polarity.tolist(), subjectivity.tolist(), labels.tolist())
+        ]
+    
+    @classmethod
+    def _get_lexicon(cls) -> Tuple[pd.Index, np.ndarray]:
+        """Build (words, [polarity, subjectivity] scores) from the TextBlob lexicon"""
+        if cls._lexicon is None:
+            pattern_lexicon.load()
+            words = [word for word in pattern_lexicon if _TOKEN_RE.fullmatch(word)]
+            scores = np.array(
+                [pattern_lexicon[word][None][:2] for word in words],
+                dtype=np.float64
+            ).reshape(-1, 2)
+            cls._lexicon = (pd.Index(words), scores)
+        return cls._lexicon
 
 
 if __name__ == "__main__":
@@ -5,12 +5,11 @@ import pytest
 import pandas as pd
 import tempfile
 import os
-import sys
- 
+
 from pipeline import SentimentPipeline
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def pipeline():
     """Create pipeline instance for tests"""
     return SentimentPipeline()
@@ -40,6 +39,21 @@ def sample_csv():
 
 class TestSentimentPipeline:
     
+    def test_analyzer_created_on_first_use(self):
+        """Test the analyzer is only constructed when first accessed"""
+        pipeline = SentimentPipeline()
+        assert pipeline._analyzer is None
+        
+        analyzer = pipeline.analyzer
+        assert analyzer is not None
+        assert pipeline.analyzer is analyzer
+    
+    @pytest.mark.parametrize('n_workers', [0, -2])
+    def test_rejects_invalid_n_workers(self, n_workers):
+        """Test worker counts below one fail at construction"""
+        with pytest.raises(ValueError, match='n_workers'):
+            SentimentPipeline(n_workers=n_workers)
+    
     def test_run_csv_pipeline(self, pipeline, sample_csv):
         """Test complete CSV pipeline"""
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
@@ -59,6 +73,8 @@ class TestSentimentPipeline:
             assert 'polarity' in result_df.columns
             assert 'subjectivity' in result_df.columns
             assert 'processed_at' in result_df.columns
+            assert pd.api.types.is_datetime64_any_dtype(result_df['processed_at'])
+            assert isinstance(result_df['sentiment'].dtype, pd.CategoricalDtype)
             
             # Verify output file was created
             assert os.path.exists(output_path)
@@ -74,17 +90,65 @@ class TestSentimentPipeline:
     def test_process_dataframe_with_empty_text(self, pipeline):
         """Test handling of empty or null text"""
         df = pd.DataFrame({
-            'text': ['Good text', '', None, 'Another good text'],
+            'text': ['Good text', '', None, 'Another good text', '   '],
         })
         
         result = pipeline._process_dataframe(df, 'text')
         
-        assert len(result) == 4
+        assert len(result) == 5
+        assert result['sentiment'].iloc[4] == 'unknown'
         assert result['sentiment'].iloc[1] == 'unknown'
         assert result['sentiment'].iloc[2] == 'unknown'
         assert result['polarity'].iloc[1] == 0.0
         assert result['polarity'].iloc[2] == 0.0
     
+    def test_process_dataframe_scores_duplicates_once(self, pipeline, monkeypatch):
+        """Test duplicate texts are analyzed once and results gathered back"""
+        df = pd.DataFrame({
+            'text': ['Great!', 'Bad', 'Great!', None, 'Bad', 'Great!'],
+        })
+        analyzed = []
+        batch_analyze = pipeline.analyzer.batch_analyze
+        
+        def recording_batch_analyze(texts, **kwargs):
+            analyzed.extend(texts)
+            return batch_analyze(texts, **kwargs)
+        
+        monkeypatch.setattr(pipeline.analyzer, 'batch_analyze', recording_batch_analyze)
+        result = pipeline._process_dataframe(df, 'text')
+        
+        assert analyzed == ['Great!', 'Bad']
+        assert result['sentiment'].tolist() == [
+            'positive', 'negative', 'positive', 'unknown', 'negative', 'positive'
+        ]
+    
+    def test_process_dataframe_keeps_text_dtype(self, pipeline, monkeypatch):
+        """Test Arrow-backed text reaches preprocess_series without an object round trip"""
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame({
+            'text': pd.array(['Great!', 'Bad', 'Great!', None], dtype='string[pyarrow]'),
+        })
+        dtypes = []
+        preprocess_series = pipeline.analyzer.preprocess_series
+        
+        def recording_preprocess_series(texts):
+            dtypes.append(texts.dtype)
+            return preprocess_series(texts)
+        
+        monkeypatch.setattr(pipeline.analyzer, 'preprocess_series', recording_preprocess_series)
+        result = pipeline._process_dataframe(df, 'text')
+        
+        assert dtypes == [pd.StringDtype('pyarrow')]
+        assert result['sentiment'].tolist() == ['positive', 'negative', 'positive', 'unknown']
+    
+    def test_summary_path_for(self, pipeline):
+        """Test summary path only replaces the output file's suffix"""
+        assert pipeline._summary_path_for('out.csv') == 'out_summary.txt'
+        assert pipeline._summary_path_for('out.jsonl') == 'out_summary.txt'
+        assert pipeline._summary_path_for(
+            os.path.join('exports.csv.d', 'results.csv')
+        ) == os.path.join('exports.csv.d', 'results_summary.txt')
+    
     def test_custom_pipeline(self, pipeline):
         """Test custom pipeline with DataFrame input"""
         df = pd.DataFrame({
@@ -112,3 +176,140 @@ class TestSentimentPipeline:
         finally:
             if os.path.exists(output_path):
                 os.remove(output_path)
+
+    def test_run_csv_pipeline_streaming(self, pipeline, sample_csv):
+        """Test chunked CSV pipeline writes every chunk once with one header"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            output_path = f.name
+        
+        try:
+            summary = pipeline.run_csv_pipeline_streaming(
+                input_csv=sample_csv,
+                output_csv=output_path,
+                text_column='review',
+                chunksize=2,
+                save_summary=False
+            )
+            
+            assert summary.total == 3
+            assert summary.sentiment_counts().sum() == 3
+            result_df = pd.read_csv(output_path)
+            assert len(result_df) == 3
+            assert result_df['sentiment'].tolist()[:2] == ['positive', 'negative']
+            assert result_df['rating'].tolist() == [5, 1, 3]
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def test_run_csv_pipeline_streaming_single_writer(self, pipeline, sample_csv, monkeypatch):
+        """Test streamed chunks are all written by pandas, even above the polars threshold"""
+        import data_handler
+        
+        def fail(df):
+            raise AssertionError("streamed chunk offered to polars")
+        
+        monkeypatch.setattr(data_handler, 'PARALLEL_CSV_MIN_ROWS', 1)
+        monkeypatch.setattr(data_handler, '_polars_csv_options', fail)
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            output_path = f.name
+        
+        try:
+            summary = pipeline.run_csv_pipeline_streaming(
+                sample_csv, output_path, 'review', chunksize=2, save_summary=False
+            )
+            
+            assert summary.total == 3
+            assert len(pd.read_csv(output_path)) == 3
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def test_run_csv_pipeline_streaming_one_executor(self, sample_csv, monkeypatch):
+        """Test every streamed chunk is scored by one worker pool, shut down afterwards"""
+        import pipeline as pipeline_module
+        import sentiment_analyzer
+        
+        executors = []
+        
+        class RecordingExecutor(pipeline_module.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                executors.append(self)
+        
+        monkeypatch.setattr(pipeline_module, 'ProcessPoolExecutor', RecordingExecutor)
+        monkeypatch.setattr(sentiment_analyzer, 'PARALLEL_MIN_TEXTS', 1)
+        pipeline = SentimentPipeline(n_workers=2)
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            output_path = f.name
+        
+        try:
+            summary = pipeline.run_csv_pipeline_streaming(
+                sample_csv, output_path, 'review', chunksize=1, save_summary=False
+            )
+            
+            assert summary.total == 3
+            assert len(executors) == 1
+            assert pipeline._executor is None
+            with pytest.raises(RuntimeError):
+                executors[0].submit(len, 'shut down')
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def test_run_json_pipeline_streaming_matches_whole_run(self, pipeline, tmp_path):
+        """Test streamed JSON Lines output keeps passthrough fields as the whole run does"""
+        import json
+        
+        input_path = tmp_path / 'input.jsonl'
+        input_path.write_text(
+            '{"zip": "01234", "created_at": "2024-01-15", "text": "Excellent product!"}\n'
+            '{"zip": "00501", "created_at": "2024-02-01", "text": "Terrible quality"}\n'
+            '{"zip": "10001", "created_at": "2024-03-09", "text": "Its okay"}\n'
+        )
+        
+        summary = pipeline.run_json_pipeline_streaming(
+            str(input_path), str(tmp_path / 'streamed.jsonl'), 'text',
+            chunksize=2, save_summary=False
+        )
+        pipeline.run_json_pipeline(
+            str(input_path), str(tmp_path / 'whole.json'), 'text', save_summary=False
+        )
+        
+        with open(tmp_path / 'streamed.jsonl') as f:
+            streamed = [json.loads(line) for line in f]
+        with open(tmp_path / 'whole.json') as f:
+            whole = json.load(f)
+        
+        assert summary.total == 3
+        passthrough = ['zip', 'created_at', 'text', 'sentiment']
+        assert [{k: r[k] for k in passthrough} for r in streamed] == [
+            {k: r[k] for k in passthrough} for r in whole
+        ]
+        assert [r['zip'] for r in streamed] == ['01234', '00501', '10001']
+        assert streamed[0]['created_at'] == '2024-01-15'
+    
+    def test_streaming_progress_log(self, pipeline, sample_csv, monkeypatch, caplog):
+        """Test streaming pipelines log running row counts between chunks"""
+        import pipeline as pipeline_module
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            output_path = f.name
+        
+        try:
+            monkeypatch.setattr(pipeline_module, 'PROGRESS_LOG_INTERVAL', 0)
+            with caplog.at_level('INFO', logger='pipeline'):
+                pipeline.run_csv_pipeline_streaming(
+                    sample_csv, output_path, 'review', chunksize=1, save_summary=False
+                )
+            
+            progress = [r.message for r in caplog.records if 'processed' in r.message]
+            assert progress == [f"{sample_csv}: processed {n} rows" for n in (1, 2, 3)]
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
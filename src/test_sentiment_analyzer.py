@@ -2,12 +2,11 @@
 Unit tests for sentiment analyzer
 """
 import pytest
-import sys
-sys.path.insert(0, '/home/claude/nlp-project/src')
+import pandas as pd
 from sentiment_analyzer import SentimentAnalyzer
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def analyzer():
     """Create analyzer instance for tests"""
     return SentimentAnalyzer()
@@ -43,6 +42,12 @@ class TestSentimentAnalyzer:
         assert 'https' not in cleaned
         assert cleaned.islower()
     
+    def test_preprocess_series(self, analyzer):
+        """Test vectorized preprocessing matches the scalar version"""
+        texts = ["Check out https://example.com! #amazing @user", "  Plain TEXT.  "]
+        cleaned = analyzer.preprocess_series(pd.Series(texts))
+        assert cleaned.tolist() == [analyzer.preprocess_text(t) for t in texts]
+    
     def test_batch_analyze(self, analyzer):
         """Test batch processing"""
         texts = [
@@ -55,6 +60,68 @@ class TestSentimentAnalyzer:
         assert all('polarity' in r for r in results)
         assert all('label' in r for r in results)
     
+    def test_batch_analyze_parallel(self, analyzer, monkeypatch):
+        """Test process pool batch matches sequential results"""
+        import sentiment_analyzer
+        texts = ["Great product!", "Terrible experience.", "It's okay."] * 4
+        expected = analyzer.batch_analyze(texts, n_jobs=1)
+        
+        monkeypatch.setattr(sentiment_analyzer, 'PARALLEL_MIN_TEXTS', 1)
+        results = analyzer.batch_analyze(texts, n_jobs=2, chunk_size=5)
+        assert results == expected
+    
+    def test_batch_analyze_shared_executor(self, analyzer, monkeypatch):
+        """Test a caller's pool is reused across batches and left running"""
+        from concurrent.futures import ProcessPoolExecutor
+        import sentiment_analyzer
+        texts = ["Great product!", "Terrible experience.", "It's okay."] * 4
+        expected = analyzer.batch_analyze(texts, n_jobs=1)
+        
+        monkeypatch.setattr(sentiment_analyzer, 'PARALLEL_MIN_TEXTS', 1)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                results = analyzer.batch_analyze(
+                    texts, n_jobs=2, chunk_size=5, executor=executor
+                )
+                assert results == expected
+    
+    def test_batch_analyze_fast(self, analyzer):
+        """Test vectorized lexicon batch processing"""
+        texts = [
+            "I love this! It's wonderful and amazing!",
+            "This is terrible and awful.",
+            "This is a sentence.",
+            ""
+        ]
+        results = analyzer.batch_analyze_fast(texts)
+        assert len(results) == 4
+        assert [r['label'] for r in results] == ['positive', 'negative', 'neutral', 'neutral']
+        assert results[3]['polarity'] == 0.0
+        assert all(isinstance(r['subjectivity'], float) for r in results)
+    
+    def test_duplicate_texts_use_cache(self, analyzer):
+        """Test repeated cleaned texts are scored once"""
+        from sentiment_analyzer import _score
+        _score.cache_clear()
+        
+        first = analyzer.analyze_sentiment("Great product!")
+        second = analyzer.analyze_sentiment("GREAT product!")
+        
+        assert first == second
+        assert _score.cache_info().hits == 1
+    
+    def test_label_codes_match_scalar_labels(self, analyzer):
+        """Test vectorized label codes agree with _get_sentiment_label"""
+        from sentiment_analyzer import SENTIMENT_LABELS
+        polarity = [-1.0, -0.1, -0.05, 0.0, 0.1, 0.11, 1.0]
+        
+        codes = analyzer.label_codes(polarity)
+        
+        assert codes.dtype == 'int8'
+        assert SENTIMENT_LABELS[codes].tolist() == [
+            analyzer._get_sentiment_label(p) for p in polarity
+        ]
+    
     def test_return_structure(self, analyzer):
         """Test that return structure is correct"""
         result = analyzer.analyze_sentiment("Test text")
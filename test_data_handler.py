@@ -6,10 +6,8 @@ import pandas as pd
 import json
 import tempfile
 import os
-import sys
 
-sys.path.insert(0, '/home/claude/nlp-project/src')
-from data_handler import DataLoader, DataSaver
+from data_handler import DataLoader, DataSaver, RunningSummary
 
 
 @pytest.fixture
@@ -59,6 +57,19 @@ def sample_dataframe():
     })
 
 
+@pytest.fixture
+def sqlite_url():
+    """Create temporary SQLite database URL for testing"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
+        filepath = f.name
+    
+    yield f"sqlite:///{filepath}"
+    
+    # Cleanup
+    if os.path.exists(filepath):
+        os.remove(filepath)
+
+
 class TestDataLoader:
     
     def test_load_from_csv(self, sample_csv_file):
@@ -69,6 +80,23 @@ class TestDataLoader:
         assert len(df) == 3
         assert 'text' in df.columns
         assert df['text'].iloc[0] == 'Great product!'
+        assert isinstance(df['text'].dtype, pd.StringDtype)
+    
+    def test_load_from_csv_usecols(self, sample_csv_file):
+        """Test restricting CSV parsing to selected columns"""
+        loader = DataLoader()
+        df = loader.load_from_csv(sample_csv_file, 'text', usecols=['id'])
+        
+        assert df.columns.tolist() == ['id', 'text']
+        assert df['text'].iloc[1] == 'Terrible experience'
+    
+    def test_load_from_csv_dtype(self, sample_csv_file):
+        """Test caller dtypes are applied and the text column stays a string"""
+        loader = DataLoader()
+        df = loader.load_from_csv(sample_csv_file, 'text', dtype={'id': 'int32', 'text': 'object'})
+        
+        assert df['id'].dtype == 'int32'
+        assert isinstance(df['text'].dtype, pd.StringDtype)
     
     def test_load_from_csv_missing_column(self, sample_csv_file):
         """Test error when column doesn't exist"""
@@ -84,6 +112,44 @@ class TestDataLoader:
         with pytest.raises(FileNotFoundError):
             loader.load_from_csv('nonexistent.csv', 'text')
     
+    def test_load_from_csv_chunks(self, sample_csv_file):
+        """Test loading CSV data in chunks"""
+        loader = DataLoader()
+        chunks = list(loader.load_from_csv_chunks(sample_csv_file, 'text', chunksize=2))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert chunks[1]['text'].iloc[0] == "It's okay"
+    
+    def test_load_from_csv_chunks_match_whole_load(self):
+        """Test whole and chunked CSV loads parse passthrough columns identically"""
+        loader = DataLoader()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            f.write("text,created_at,zip\n")
+            f.write("Great product!,2024-01-15T10:00:00,01234\n")
+            f.write("Terrible experience,2024-02-01T08:30:00,00501\n")
+            f.write("It's okay,2024-03-09T17:45:00,10001\n")
+            filepath = f.name
+        
+        try:
+            whole = loader.load_from_csv(filepath, 'text', dtype={'zip': str})
+            chunks = loader.load_from_csv_chunks(filepath, 'text', chunksize=2, dtype={'zip': str})
+            streamed = pd.concat(list(chunks), ignore_index=True)
+            
+            pd.testing.assert_frame_equal(streamed, whole)
+            assert whole['created_at'].iloc[0] == '2024-01-15T10:00:00'
+            assert whole['zip'].tolist() == ['01234', '00501', '10001']
+        
+        finally:
+            os.remove(filepath)
+    
+    def test_load_from_csv_chunks_missing_column(self, sample_csv_file):
+        """Test chunked loading validates the column before reading rows"""
+        loader = DataLoader()
+        
+        with pytest.raises(ValueError, match="Column .* not found"):
+            loader.load_from_csv_chunks(sample_csv_file, 'nonexistent')
+    
     def test_load_from_json(self, sample_json_file):
         """Test loading data from JSON"""
         loader = DataLoader()
@@ -93,6 +159,77 @@ class TestDataLoader:
         assert 'text' in df.columns
         assert df['text'].iloc[0] == 'Amazing!'
     
+    def test_load_from_json_lines(self):
+        """Test loading data from JSON Lines"""
+        loader = DataLoader()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            f.write('{"id": 1, "text": "Amazing!"}\n{"id": 2, "text": "Not good"}\n')
+            filepath = f.name
+        
+        try:
+            df = loader.load_from_json(filepath, 'text')
+            
+            assert len(df) == 2
+            assert df['text'].tolist() == ['Amazing!', 'Not good']
+        
+        finally:
+            os.remove(filepath)
+    
+    def test_load_from_json_chunks_matches_whole_load(self):
+        """Test streamed JSON Lines keep field types exactly as load_from_json does"""
+        loader = DataLoader()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            f.write(
+                '{"zip": "01234", "created_at": "2024-01-15", "score": 1, "text": "Amazing!"}\n'
+                '{"zip": "00501", "created_at": "2024-02-01", "score": 2, "text": "Not good"}\n'
+                '\n'
+                '{"zip": "10001", "created_at": "2024-03-09", "score": 3, "text": "Okay"}\n'
+            )
+            filepath = f.name
+        
+        try:
+            chunks = list(loader.load_from_json_chunks(filepath, 'text', chunksize=2))
+            whole = loader.load_from_json(filepath, 'text')
+            
+            assert [len(chunk) for chunk in chunks] == [2, 1]
+            streamed = pd.concat(chunks, ignore_index=True)
+            pd.testing.assert_frame_equal(streamed, whole)
+            assert streamed['zip'].tolist() == ['01234', '00501', '10001']
+            assert streamed['created_at'].iloc[0] == '2024-01-15'
+            
+            with pytest.raises(ValueError, match="Field .* not found"):
+                loader.load_from_json_chunks(filepath, 'nonexistent')
+        
+        finally:
+            os.remove(filepath)
+    
+    def test_load_from_parquet(self, sample_dataframe):
+        """Test loading selected columns from Parquet"""
+        pytest.importorskip('pyarrow')
+        loader = DataLoader()
+        
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.parquet') as f:
+            filepath = f.name
+        sample_dataframe.to_parquet(filepath, index=False)
+        
+        try:
+            df = loader.load_from_parquet(filepath, 'text', usecols=['sentiment'])
+            
+            assert df.columns.tolist() == ['text', 'sentiment']
+            assert df['text'].tolist() == sample_dataframe['text'].tolist()
+            assert isinstance(df['text'].dtype, pd.StringDtype)
+            
+            with pytest.raises(ValueError, match="Column .* not found"):
+                loader.load_from_parquet(filepath, 'nonexistent')
+            
+            with pytest.raises(ValueError, match=r"\['typo'\] not found in Parquet"):
+                loader.load_from_parquet(filepath, 'text', usecols=['sentiment', 'typo'])
+        
+        finally:
+            os.remove(filepath)
+    
     def test_load_from_json_missing_field(self, sample_json_file):
         """Test error when field doesn't exist"""
         loader = DataLoader()
@@ -133,6 +270,65 @@ class TestDataSaver:
             if os.path.exists(output_path):
                 os.remove(output_path)
     
+    @pytest.mark.parametrize('processed_at', [
+        pd.Timestamp('2026-10-15 10:51:05.635497'),
+        pd.Timestamp('2026-10-15 10:51:05'),
+        pd.Timestamp('2026-10-15')
+    ])
+    def test_save_to_csv_parallel_matches_pandas(self, sample_dataframe, monkeypatch, processed_at):
+        """Test large-frame CSV path writes the same bytes as DataFrame.to_csv"""
+        pytest.importorskip('polars')
+        import data_handler
+        monkeypatch.setattr(data_handler, 'PARALLEL_CSV_MIN_ROWS', 1)
+        saver = DataSaver()
+        
+        df = sample_dataframe.assign(
+            text=['Excellent', 'Poor, "really"', None],
+            processed_at=processed_at,
+            sentiment=pd.Categorical(
+                sample_dataframe['sentiment'],
+                categories=['positive', 'neutral', 'negative', 'unknown']
+            ),
+            rating=pd.array([5, None, 3], dtype='Int64'),
+            score=[1.850372e-17, 1e20, float('nan')]
+        )
+        assert data_handler._polars_csv_options(df) is not None
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
+            output_path = f.name
+        
+        try:
+            saver.save_to_csv(df, output_path)
+            
+            with open(output_path, 'r', newline='') as f:
+                assert f.read() == df.to_csv(index=False)
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    @pytest.mark.parametrize('column, alone', [
+        ([True, False, True], False),
+        ([5e-06, 0.5, 0.25], False),
+        (['', 'Poor', 'Average'], False),
+        (['Excel\rlent', 'Poor', 'Average'], False),
+        ([pd.Timestamp('2026-10-15'), pd.NaT, pd.Timestamp('2026-10-16')], False),
+        # Nulls are only written differently when they fill a whole line
+        (pd.array(['Excellent', None, 'Average'], dtype='string'), True),
+        (pd.Categorical(['Excellent', None, 'Average']), True),
+        ([0.8, float('nan'), 0.1], True)
+    ])
+    def test_polars_csv_options_rejects_differing_formats(self, sample_dataframe, column, alone):
+        """Test frames polars would format differently from pandas stay on pandas"""
+        from data_handler import _polars_csv_options
+        
+        assert _polars_csv_options(sample_dataframe) is not None
+        if alone:
+            assert _polars_csv_options(sample_dataframe.assign(extra=column)) is not None
+            assert _polars_csv_options(pd.DataFrame({'extra': column})) is None
+        else:
+            assert _polars_csv_options(sample_dataframe.assign(extra=column)) is None
+    
     def test_save_to_json(self, sample_dataframe):
         """Test saving DataFrame to JSON"""
         saver = DataSaver()
@@ -153,6 +349,170 @@ class TestDataSaver:
             if os.path.exists(output_path):
                 os.remove(output_path)
     
+    @pytest.mark.parametrize('lines', [False, True])
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_save_to_json_decimal_and_timedelta(self, monkeypatch, lines, use_orjson):
+        """Test Decimal and Timedelta values serialize the same with or without orjson"""
+        from decimal import Decimal
+        import data_handler
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(data_handler, 'orjson', None)
+        saver = DataSaver()
+        df = pd.DataFrame({
+            'amount': [Decimal('1.5'), None],
+            'elapsed': pd.to_timedelta(['1s', '90min'])
+        })
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            output_path = f.name
+        
+        try:
+            saver.save_to_json(df, output_path, lines=lines)
+            
+            with open(output_path, 'r') as f:
+                data = [json.loads(line) for line in f] if lines else json.load(f)
+            assert data == [
+                {'amount': '1.5', 'elapsed': 'P0DT0H0M1S'},
+                {'amount': None, 'elapsed': 'P0DT1H30M0S'}
+            ]
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def test_save_to_parquet(self, sample_dataframe):
+        """Test saving DataFrame to Parquet"""
+        pytest.importorskip('pyarrow')
+        saver = DataSaver()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.parquet') as f:
+            output_path = f.name
+        
+        try:
+            saver.save_to_parquet(sample_dataframe, output_path)
+            
+            df_loaded = pd.read_parquet(output_path)
+            pd.testing.assert_frame_equal(df_loaded, sample_dataframe)
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def test_save_to_feather(self, sample_dataframe):
+        """Test saving DataFrame to Feather"""
+        pytest.importorskip('pyarrow')
+        saver = DataSaver()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.feather') as f:
+            output_path = f.name
+        
+        try:
+            saver.save_to_feather(sample_dataframe, output_path)
+            
+            df_loaded = pd.read_feather(output_path)
+            pd.testing.assert_frame_equal(df_loaded, sample_dataframe)
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def test_database_round_trip(self, sample_dataframe, sqlite_url):
+        """Test saving to and loading from a database through a shared engine"""
+        import data_handler
+        saver = DataSaver()
+        loader = DataLoader()
+        
+        saver.save_to_database(sample_dataframe, sqlite_url, 'results', if_exists='replace')
+        df = loader.load_from_database(sqlite_url, 'SELECT * FROM results', 'text')
+        
+        assert df['text'].tolist() == sample_dataframe['text'].tolist()
+        assert sqlite_url in data_handler._ENGINE_CACHE
+        data_handler._ENGINE_CACHE.pop(sqlite_url).dispose()
+    
+    def test_postgres_copy_statement(self):
+        """Test COPY insert method streams rows as CSV"""
+        from unittest import mock
+        from sqlalchemy.dialects import postgresql
+        from data_handler import _postgres_copy
+        
+        cursor = mock.MagicMock()
+        conn = mock.MagicMock()
+        conn.dialect = postgresql.dialect()
+        conn.connection.cursor.return_value.__enter__.return_value = cursor
+        table = mock.Mock(schema='Reports')
+        table.name = 'results'
+        
+        _postgres_copy(table, conn, ['text', 'Polarity'], [('Great, really', 0.8), ('Bad', None)])
+        
+        sql, buffer = cursor.copy_expert.call_args[0]
+        assert sql == (
+            'COPY "Reports".results (text, "Polarity") FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+        )
+        assert buffer.read() == '"Great, really",0.8\r\n"Bad",\\N\r\n'
+    
+    def test_csv_row_reader_keeps_empty_strings(self):
+        """Test COPY rows tell empty strings and literal \\N text apart from NULL"""
+        from data_handler import _CsvRowReader
+        
+        reader = _CsvRowReader([('', 1), (None, 2), ('\\N', 3)])
+        
+        assert reader.read() == '"",1\r\n\\N,2\r\n"\\N",3\r\n'
+    
+    def test_csv_row_reader_sized_reads(self):
+        """Test COPY source stream renders rows lazily across sized reads"""
+        from data_handler import _CsvRowReader
+        
+        rows = [(i, f'text {i}') for i in range(100)]
+        expected = ''.join(f'{i},"text {i}"\r\n' for i in range(100))
+        reader = _CsvRowReader(rows)
+        
+        parts = []
+        while True:
+            part = reader.read(64)
+            if not part:
+                break
+            assert len(part) <= 64
+            parts.append(part)
+        
+        assert ''.join(parts) == expected
+    
+    def test_load_from_database_chunks(self, sample_dataframe, sqlite_url):
+        """Test loading query results in chunks"""
+        import data_handler
+        saver = DataSaver()
+        loader = DataLoader()
+        
+        saver.save_to_database(sample_dataframe, sqlite_url, 'results', if_exists='replace')
+        chunks = list(loader.load_from_database_chunks(
+            sqlite_url, 'SELECT * FROM results', 'text', chunksize=2
+        ))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        with pytest.raises(ValueError, match="Column .* not found"):
+            list(loader.load_from_database_chunks(sqlite_url, 'SELECT * FROM results', 'nonexistent'))
+        data_handler._ENGINE_CACHE.pop(sqlite_url).dispose()
+    
+    def test_save_to_json_lines_append(self, sample_dataframe):
+        """Test appending JSON Lines output"""
+        saver = DataSaver()
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            output_path = f.name
+        
+        try:
+            saver.save_to_json(sample_dataframe, output_path, lines=True)
+            saver.save_to_json(sample_dataframe, output_path, lines=True, append=True)
+            
+            df_loaded = pd.read_json(output_path, lines=True)
+            assert len(df_loaded) == 2 * len(sample_dataframe)
+            assert df_loaded['text'].tolist()[:3] == ['Excellent', 'Poor', 'Average']
+        
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
     def test_save_summary_stats(self, sample_dataframe):
         """Test saving summary statistics"""
         saver = DataSaver()
@@ -175,3 +535,32 @@ class TestDataSaver:
         finally:
             if os.path.exists(output_path):
                 os.remove(output_path)
+    
+    def test_score_stats_matches_pandas(self):
+        """Test the NumPy summary reduction agrees with DataFrame.agg"""
+        import numpy as np
+        from data_handler import SUMMARY_STATS, _score_stats
+        
+        df = pd.DataFrame({
+            'polarity': [0.8, -0.7, 0.1, 0.0],
+            'subjectivity': [0.9, 0.8, 0.5, np.nan]
+        })
+        for frame in (df[['polarity']], df):
+            stats = _score_stats(frame.to_numpy(dtype=np.float64), list(frame.columns))
+            pd.testing.assert_frame_equal(stats, frame.agg(SUMMARY_STATS))
+
+
+class TestRunningSummary:
+    
+    def test_matches_full_frame_statistics(self, sample_dataframe):
+        """Test chunked accumulation matches whole-frame statistics"""
+        summary = RunningSummary()
+        summary.update(sample_dataframe.iloc[:2])
+        summary.update(sample_dataframe.iloc[2:])
+        
+        stats = summary.stats()
+        expected = sample_dataframe[['polarity', 'subjectivity']].agg(['mean', 'std', 'min', 'max'])
+        
+        assert summary.total == 3
+        assert summary.sentiment_counts().to_dict() == {'positive': 1, 'negative': 1, 'neutral': 1}
+        pd.testing.assert_frame_equal(stats.loc[expected.index, expected.columns], expected)